@@ -0,0 +1,103 @@
+// Native kernel for the per-step snake logic, built as a MicroPython
+// dynamic native module (natmod). main.py falls back to the Python
+// implementation when snake_kernel.mpy is not on the device.
+
+#include "py/dynruntime.h"
+
+// Must match _EVENT_* in main.py
+#define EVENT_MOVE (0)
+#define EVENT_EAT (1)
+#define EVENT_CRASH (2)
+
+// snake_step(wall_mask, xs, ys, head_idx, length, grid_w, grid_h, dir_x, dir_y, food_x, food_y)
+//
+// Moves the head one tile in (dir_x, dir_y), wrapping at the edges, and
+// returns new_x | new_y << 8 | event << 16 as a small int so no tuple is
+// allocated. The snake itself is not modified.
+static mp_obj_t snake_step(size_t n_args, const mp_obj_t *args) {
+    mp_buffer_info_t wall_info, xs_info, ys_info;
+    mp_get_buffer_raise(args[0], &wall_info, MP_BUFFER_READ);
+    mp_get_buffer_raise(args[1], &xs_info, MP_BUFFER_READ);
+    mp_get_buffer_raise(args[2], &ys_info, MP_BUFFER_READ);
+
+    const uint8_t *wall_mask = wall_info.buf;
+    const uint8_t *xs = xs_info.buf;
+    const uint8_t *ys = ys_info.buf;
+    mp_int_t capacity = xs_info.len;
+
+    mp_int_t head = mp_obj_get_int(args[3]);
+    mp_int_t length = mp_obj_get_int(args[4]);
+    mp_int_t grid_w = mp_obj_get_int(args[5]);
+    mp_int_t grid_h = mp_obj_get_int(args[6]);
+    mp_int_t dir_x = mp_obj_get_int(args[7]);
+    mp_int_t dir_y = mp_obj_get_int(args[8]);
+    mp_int_t food_x = mp_obj_get_int(args[9]);
+    mp_int_t food_y = mp_obj_get_int(args[10]);
+
+    // Check everything used to index the buffers. The kernel avoids division
+    // so it links on armv6m, which has no hardware divide. Coordinates are
+    // stored as bytes, so the grid is at most 256 tiles in each direction.
+    if (grid_w <= 0 || grid_w > 256 || grid_h <= 0 || grid_h > 256
+        || (size_t)(grid_w * grid_h) > wall_info.len) {
+        mp_raise_ValueError(MP_ERROR_TEXT("grid size doesn't match wall_mask"));
+    }
+    if (capacity <= 0 || ys_info.len < xs_info.len) {
+        mp_raise_ValueError(MP_ERROR_TEXT("xs and ys must be the same size"));
+    }
+    if (head < 0 || head >= capacity || length < 0 || length > capacity) {
+        mp_raise_ValueError(MP_ERROR_TEXT("head_idx or length out of range"));
+    }
+    if (dir_x < -1 || dir_x > 1 || dir_y < -1 || dir_y > 1) {
+        mp_raise_ValueError(MP_ERROR_TEXT("direction must move at most one tile"));
+    }
+
+    mp_int_t x = xs[head] + dir_x;
+    mp_int_t y = ys[head] + dir_y;
+
+    // The head only ever moves one tile
+    if (x < 0) {
+        x = grid_w - 1;
+    } else if (x == grid_w) {
+        x = 0;
+    }
+    if (y < 0) {
+        y = grid_h - 1;
+    } else if (y == grid_h) {
+        y = 0;
+    }
+    if (x < 0 || x >= grid_w || y < 0 || y >= grid_h) {
+        mp_raise_ValueError(MP_ERROR_TEXT("head is outside the grid"));
+    }
+
+    mp_int_t event = EVENT_MOVE;
+
+    if (x == food_x && y == food_y) {
+        event = EVENT_EAT;
+    } else if (dir_x != 0 || dir_y != 0) {
+        if (wall_mask[y * grid_w + x]) {
+            event = EVENT_CRASH;
+        } else {
+            // Walk the body from the head back to the tail
+            mp_int_t i = head;
+            for (mp_int_t n = 0; n < length; ++n) {
+                if (xs[i] == x && ys[i] == y) {
+                    event = EVENT_CRASH;
+                    break;
+                }
+                i = (i == 0 ? capacity : i) - 1;
+            }
+        }
+    }
+
+    return mp_obj_new_int(x | (y << 8) | (event << 16));
+}
+static MP_DEFINE_CONST_FUN_OBJ_VAR_BETWEEN(snake_step_obj, 11, 11, snake_step);
+
+// Module entry point, called when the .mpy is imported
+mp_obj_t mpy_init(mp_obj_fun_bc_t *self, size_t n_args, size_t n_kw, mp_obj_t *args) {
+    MP_DYNRUNTIME_INIT_ENTRY
+
+    mp_store_global(MP_QSTR_snake_step, MP_OBJ_FROM_PTR(&snake_step_obj));
+
+    MP_DYNRUNTIME_INIT_EXIT
+}
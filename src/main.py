@@ -1,4 +1,7 @@
+import micropython
 import utime
+from array import array
+from micropython import const
 from random import randint
 
 from machine import I2C
@@ -6,6 +9,13 @@ from presto import Presto
 
 from qwstpad import ADDRESSES, QwSTPad
 
+# Optional native kernel, see natmod/snake_kernel. A .mpy built for another
+# MicroPython version or architecture raises ValueError rather than ImportError.
+try:
+    from snake_kernel import snake_step
+except (ImportError, ValueError):
+    snake_step = None
+
 """
 Snake Game ported for the Presto.
 
@@ -36,124 +46,232 @@ TITLE_COLOR = display.create_pen(255, 255, 0) # Yellow
 SCORE_COLOR = display.create_pen(255, 255, 255) # White
 BACKGROUND_COLOR = display.create_pen(0, 0, 0) # Black
 
-tile_size = 12
-grid_w = WIDTH // tile_size
-grid_h = HEIGHT // tile_size
+_TILE_SIZE = const(12)
+_TILE_HALF = const(_TILE_SIZE // 2)
+_SNAKE_RADIUS = const((_TILE_SIZE - 4) // 2)
+_FOOD_RADIUS = const((_TILE_SIZE - 2) // 2)
+_LINE_THICKNESS = const(4)
+_LINE_OFFSET = const(_LINE_THICKNESS // 2)
+
+# Depend on the display size, so these can't be const()
+grid_w = WIDTH // _TILE_SIZE
+grid_h = HEIGHT // _TILE_SIZE
 
 i2c = I2C(**I2C_PINS)
 complete = False
 
 
-class State:
-    TITLE = 0
-    LEVEL = 1
-    LIVES = 2
-    PLAYING = 3
-    SCORE = 4
-    GAME_OVER = 5
+# Game states, also used to index the per-state handlers in Game
+_STATE_TITLE = const(0)
+_STATE_LEVEL = const(1)
+_STATE_LIVES = const(2)
+_STATE_PLAYING = const(3)
+_STATE_SCORE = const(4)
+_STATE_GAME_OVER = const(5)
 
-
-class Node:
-    def __init__(self, position=None, direction=None, next=None) -> None:
-        self.position = position
-        self.direction = direction
-        self.next = next
+# Results of Snake.step, must match natmod/snake_kernel. Snake.step packs the
+# new head and the event into one small int, x | y << 8 | event << 16, so a
+# step doesn't allocate a tuple.
+_EVENT_MOVE = const(0)
+_EVENT_EAT = const(1)
+_EVENT_CRASH = const(2)
 
 
 class Snake:
     def __init__(self) -> None:
-        center = grid_w//2, grid_h//2
+        # Body stored as a ring buffer of grid coordinates, tail -> head.
+        # px/py hold the matching tile centres in pixels for drawing.
+        capacity = grid_w * grid_h
+        self.xs = bytearray(capacity)
+        self.ys = bytearray(capacity)
+        self.px = array('H', [0] * capacity)
+        self.py = array('H', [0] * capacity)
+        self.head_idx = 0
+        self.tail_idx = 0
+        self.length = 1
+
+        # Number of segments on each grid cell. A stationary snake pushes onto
+        # its own head before popping, so this is a count rather than a flag.
+        self.occupied = bytearray(capacity)
+
+        self.xs[0] = grid_w // 2
+        self.ys[0] = grid_h // 2
+        self.occupied[self.ys[0] * grid_w + self.xs[0]] = 1
+        self.px[0] = self.xs[0] * _TILE_SIZE + _TILE_HALF
+        self.py[0] = self.ys[0] * _TILE_SIZE + _TILE_HALF
         self.direction = (0, 0)
-        self.head = Node(center, self.direction)
-
-    def push(self, new_head) -> None:
-        new_head.next = self.head
-        self.head = new_head
+        # Ring index of the tile vacated by the last pop, -1 after a push
+        self.prev_tail = -1
+
+    def push(self, x, y) -> None:
+        i = (self.head_idx + 1) % len(self.xs)
+        self.xs[i] = x
+        self.ys[i] = y
+        self.px[i] = x * _TILE_SIZE + _TILE_HALF
+        self.py[i] = y * _TILE_SIZE + _TILE_HALF
+        self.occupied[y * grid_w + x] += 1
+        self.head_idx = i
+        self.length += 1
+        self.prev_tail = -1
 
     def __len__(self) -> int:
-        length = 0
-        current = self.head
-        while current:
-            length += 1
-            current = current.next
-        return length
+        return self.length
 
 
     def pop(self) -> None:
-        current = self.head
-        previous = None
-
-        while current.next:
-            previous = current
-            current = current.next
-
-        if previous:
-            previous.next = None
-
-
-    def contains(self, position) -> bool:
-        current = self.head
-
-        while current:
-            if current.position == position:
+        # The vacated cell stays in xs/ys until the ring wraps round to it,
+        # so remembering its index is enough for show_changes
+        tail = self.tail_idx
+        self.occupied[self.ys[tail] * grid_w + self.xs[tail]] -= 1
+        self.prev_tail = tail
+        self.tail_idx = (tail + 1) % len(self.xs)
+        self.length -= 1
+
+
+    @micropython.viper
+    def contains(self, x: int, y: int) -> bool:
+        xs = ptr8(self.xs)
+        ys = ptr8(self.ys)
+        capacity = int(len(self.xs))
+        i = int(self.tail_idx)
+        remaining = int(self.length)
+
+        while remaining > 0:
+            if xs[i] == x and ys[i] == y:
                 return True
-            current = current.next
+            i += 1
+            if i == capacity:
+                i = 0
+            remaining -= 1
 
         return False
 
 
-    def move(self) -> Node:
+    @micropython.native
+    def move(self) -> int:
+        # Returns the next head position packed as x | y << 8
         x, y = self.direction
-        head_x, head_y = self.head.position
+        head_x = self.xs[self.head_idx]
+        head_y = self.ys[self.head_idx]
 
         head_x += x
         head_y += y
 
-        head_x %= grid_w
-        head_y %= grid_h
+        # The head only ever moves one tile, so wrapping needs no modulo
+        if head_x < 0:
+            head_x = grid_w - 1
+        elif head_x == grid_w:
+            head_x = 0
+
+        if head_y < 0:
+            head_y = grid_h - 1
+        elif head_y == grid_h:
+            head_y = 0
+
+        return head_x | (head_y << 8)
+
+
+    def step(self, level, food) -> int:
+        # Returns x | y << 8 | event << 16 for the next head position,
+        # without moving the snake
+        if snake_step:
+            direction_x, direction_y = self.direction
+            food_x, food_y = food.position
+            return snake_step(level.wall_mask, self.xs, self.ys, self.head_idx, self.length,
+                              grid_w, grid_h, direction_x, direction_y, food_x, food_y)
+
+        new_head = self.move()
+        new_x = new_head & 0xFF
+        new_y = new_head >> 8
+        food_x, food_y = food.position
 
-        new_node = Node((head_x, head_y), self.direction)
+        if new_x == food_x and new_y == food_y:
+            return new_head | (_EVENT_EAT << 16)
 
-        return new_node
+        if self.moving() and (level.check_walls(new_x, new_y) or self.contains(new_x, new_y)):
+            return new_head | (_EVENT_CRASH << 16)
 
+        return new_head | (_EVENT_MOVE << 16)
 
+
+    @micropython.viper
     def show(self):
         display.set_pen(SNAKE_COLOR)
 
-        current = self.head
-        previous = None
+        line = self.line
+        px = ptr16(self.px)
+        py = ptr16(self.py)
+        capacity = int(len(self.xs))
+        i = int(self.head_idx)
+
+        x2 = px[i]
+        y2 = py[i]
+        display.circle(x2, y2, _SNAKE_RADIUS)
+
+        remaining = int(self.length) - 1
+        while remaining > 0:
+            if i == 0:
+                i = capacity
+            i -= 1
+            x1 = px[i]
+            y1 = py[i]
+
+            # Segments that wrap around the edge of the screen are not drawn
+            dx = x1 - x2
+            dy = y1 - y2
+            if dx <= _TILE_SIZE and dx >= -_TILE_SIZE and dy <= _TILE_SIZE and dy >= -_TILE_SIZE:
+                line(x1, y1, x2, y2)
+
+            x2 = x1
+            y2 = y1
+            remaining -= 1
+
+
+    @micropython.native
+    def show_changes(self) -> None:
+        # Every part of the snake stays inside the tiles it joins, so after a
+        # push/pop only the tail and the two front tiles need repainting.
+        rect = display.rectangle
+        segment = self.segment
+        xs = self.xs
+        ys = self.ys
+        capacity = len(xs)
+        length = self.length
+        prev_tail = self.prev_tail
+        head = self.head_idx
+        neck = (head - 1) % capacity
+        tail = self.tail_idx
 
-        while current:
-            if current != self.head and previous is not None:
-                x1, y1 = current.position
-                x2, y2 = previous.position
+        display.set_pen(BACKGROUND_COLOR)
+        if prev_tail >= 0:
+            rect(xs[prev_tail] * _TILE_SIZE, ys[prev_tail] * _TILE_SIZE, _TILE_SIZE, _TILE_SIZE)
+            rect(xs[tail] * _TILE_SIZE, ys[tail] * _TILE_SIZE, _TILE_SIZE, _TILE_SIZE)
+        if length > 1:
+            rect(xs[neck] * _TILE_SIZE, ys[neck] * _TILE_SIZE, _TILE_SIZE, _TILE_SIZE)
+        rect(xs[head] * _TILE_SIZE, ys[head] * _TILE_SIZE, _TILE_SIZE, _TILE_SIZE)
 
-                invisible = abs(x1 - x2) > 1 or abs(y1 - y2) > 1
+        display.set_pen(SNAKE_COLOR)
+        if prev_tail >= 0 and length > 1:
+            segment(tail, (tail + 1) % capacity)
+        if length > 1:
+            segment(neck, head)
+        if length > 2:
+            segment((neck - 1) % capacity, neck)
 
-                if not invisible:
-                    x1 *= tile_size
-                    y1 *= tile_size
-                    x2 *= tile_size
-                    y2 *= tile_size
+        display.circle(self.px[head], self.py[head], _SNAKE_RADIUS)
 
-                    x1 += tile_size // 2
-                    y1 += tile_size // 2
-                    x2 += tile_size // 2
-                    y2 += tile_size // 2
-                    self.line(x1, y1, x2, y2)
-            else:
-                x, y = current.position
-                x *= tile_size
-                y *= tile_size
 
-                center_x = x + tile_size // 2
-                center_y = y + tile_size // 2
-                radius = tile_size - 4 // 2
+    def segment(self, i, j) -> None:
+        px = self.px
+        py = self.py
+        x1, y1 = px[i], py[i]
+        x2, y2 = px[j], py[j]
 
-                display.circle(center_x, center_y, radius)
+        # Segments that wrap around the edge of the screen are not drawn
+        if abs(x1 - x2) > _TILE_SIZE or abs(y1 - y2) > _TILE_SIZE:
+            return
 
-            previous = current
-            current = current.next
+        self.line(x1, y1, x2, y2)
 
 
     def moving(self) -> bool:
@@ -171,24 +289,18 @@ class Snake:
             self.direction = (1, 0)
 
 
-    def line(self, x1, y1, x2, y2):
-        start_x = min(x1, x2)
-        stary_y = min(y1, y2)
-
-        line_thinkness = 4
-        offset = line_thinkness // 2
-
-        start_x -= offset
-        stary_y -= offset
-
-        if x1 == x2:
-            line_width = offset * 2
-            line_height = offset + abs(y1 - y2) + offset
+    @micropython.viper
+    def line(self, x1: int, y1: int, x2: int, y2: int):
+        # Segments are always horizontal or vertical, so a single rectangle
+        # padded by half the line thickness on each side covers both cases
+        dx = x2 - x1
+        dy = y2 - y1
+        start_x = (x1 if dx >= 0 else x2) - _LINE_OFFSET
+        start_y = (y1 if dy >= 0 else y2) - _LINE_OFFSET
+        line_width = (dx if dx >= 0 else -dx) + _LINE_THICKNESS
+        line_height = (dy if dy >= 0 else -dy) + _LINE_THICKNESS
 
-        elif y1 == y2:
-            line_width = offset + abs(x1 - x2) + offset
-            line_height = offset * 2
-        display.rectangle(start_x, stary_y, line_width, line_height)
+        display.rectangle(start_x, start_y, line_width, line_height)
 
 
 class Level:
@@ -197,31 +309,70 @@ class Level:
 
 
     def load_level(self, level_number) -> None:
-        self.walls = []
+        self.wall_mask = bytearray(grid_w * grid_h)
         filename = f"level-{level_number}.txt"
 
         try:
-            with open(filename, "r") as f:
-                lines = f.readlines()
-                for y, line in enumerate(lines):
-                    for x, char in enumerate(line):
-                        if char == '0' and 0 <= y < grid_h and 0 <= x < grid_w:
-                            self.walls.append((x, y))
+            with open(filename, "rb") as f:
+                y = 0
+                for line in f:
+                    if y >= grid_h:
+                        break
+
+                    # Let bytes.find scan for the walls instead of a Python loop
+                    row = y * grid_w
+                    x = line.find(b'0')
+                    while 0 <= x < grid_w:
+                        self.wall_mask[row + x] = 1
+                        x = line.find(b'0', x + 1)
+                    y += 1
         except OSError:
             print(f"File not found: {filename}, using an empty level.")
         except Exception as e:
             print(f"Error loading level: {e}")
 
+        self.build_wall_rects()
+
+        # Every cell that food could ever be placed on
+        self.free_cells = array('H', [i for i in range(grid_w * grid_h) if not self.wall_mask[i]])
+
+
+    def build_wall_rects(self) -> None:
+        # Walls never move, so merge each horizontal run of wall tiles into
+        # one (x, y, w, h) rectangle in pixels, ready to draw
+        self.wall_rects = array('H')
+
+        for y in range(grid_h):
+            row = y * grid_w
+            x = 0
+            while x < grid_w:
+                if not self.wall_mask[row + x]:
+                    x += 1
+                    continue
+
+                start = x
+                while x < grid_w and self.wall_mask[row + x]:
+                    x += 1
+
+                self.wall_rects.extend((start * _TILE_SIZE, y * _TILE_SIZE, (x - start) * _TILE_SIZE, _TILE_SIZE))
 
-    def check_walls(self, position) -> bool:
-        return position in self.walls
 
+    @micropython.native
+    def check_walls(self, x, y) -> bool:
+        return self.wall_mask[y * grid_w + x] != 0
 
-    def show(self) -> None:
-        for wall in self.walls:
-            x, y = wall
-            display.set_pen(WALL_COLOR)
-            display.rectangle(x * tile_size, y * tile_size, tile_size, tile_size)
+
+    @micropython.viper
+    def show(self):
+        display.set_pen(WALL_COLOR)
+
+        rect = display.rectangle
+        rects = ptr16(self.wall_rects)
+        count = int(len(self.wall_rects))
+        i = 0
+        while i < count:
+            rect(rects[i], rects[i + 1], rects[i + 2], rects[i + 3])
+            i += 4
 
 
 class Food:
@@ -229,26 +380,30 @@ class Food:
         self.reset_position(snake, level)
 
 
+    @micropython.native
     def reset_position(self, snake, level) -> None:
-        new_position = (randint(0, grid_w - 1), randint(0, grid_h - 1))
+        # Only retries when the pick lands on the snake, which is rare
+        # because the snake covers a small part of the free cells
+        free_cells = level.free_cells
+        occupied = snake.occupied
+        last = len(free_cells) - 1
 
-        while snake.contains(new_position) or level.check_walls(new_position):
-            new_position = (randint(0, grid_w - 1), randint(0, grid_h - 1))
+        cell = free_cells[randint(0, last)]
+        while occupied[cell]:
+            cell = free_cells[randint(0, last)]
 
-        self.position = new_position
+        self.position = (cell % grid_w, cell // grid_w)
 
 
     def show(self):
         x, y = self.position
         display.set_pen(FOOD_COLOR)
-        display.rectangle(x * tile_size, y * tile_size, tile_size, tile_size)
+        display.rectangle(x * _TILE_SIZE, y * _TILE_SIZE, _TILE_SIZE, _TILE_SIZE)
 
-        tile_x = (tile_size * x) + tile_size // 2
-        tile_y = (tile_size * y) + tile_size // 2
+        tile_x = (_TILE_SIZE * x) + _TILE_HALF
+        tile_y = (_TILE_SIZE * y) + _TILE_HALF
 
-        radius = (tile_size - 2) // 2
-        display.set_pen(FOOD_COLOR)
-        display.circle(tile_x, tile_y, radius)
+        display.circle(tile_x, tile_y, _FOOD_RADIUS)
 
 
 
@@ -256,10 +411,19 @@ class Game:
     def __init__(self, pad) -> None:
         self.pad = pad
         self.pressed = {}
+        self.text_widths = {}
         self.frameCount = 0
         self.score = 0
         self.target_score = 5
         self.base_refresh = 0.01
+        self.refresh_ms = int(self.base_refresh * 1000)
+
+        # Bound once so the per-frame pacing skips the module lookups
+        self.ticks_ms = utime.ticks_ms
+        self.ticks_add = utime.ticks_add
+        self.ticks_diff = utime.ticks_diff
+        self.sleep_ms = utime.sleep_ms
+        self.next_deadline = self.ticks_ms()
 
         self.countdown = 20
         self.cooldown = self.countdown
@@ -267,7 +431,26 @@ class Game:
 
         self.level_number = 0
         self.total_levels = 4
-        self.state = State.TITLE
+        self.state = _STATE_TITLE
+        self.update_speed()
+
+        # Per-state handlers, indexed by state (PLAYING has none)
+        self.text_handlers = (
+            self.title_text,
+            self.level_text,
+            self.lives_text,
+            None,
+            self.score_text,
+            self.game_over_text,
+        )
+        self.transitions = (
+            self.end_title,
+            self.end_level,
+            self.end_lives,
+            None,
+            self.end_score,
+            self.end_game_over,
+        )
 
 
     def init_level(self) -> None:
@@ -275,88 +458,127 @@ class Game:
         self.snake = Snake()
         self.food = Food(self.snake, self.level)
         self.score = 0
+        self.update_speed()
 
 
-    def tick(self) -> None:
+    def update_speed(self) -> None:
+        # Only changes with the score, so cache it instead of mapping every tick
         self.frame_skip = self.map_to_range(self.score, 0, 50, self.slow, self.fast)
 
-        if self.frameCount % self.frame_skip == 0:
-            self.update_inputs()
+
+    @micropython.native
+    def tick(self) -> None:
+        self.frameCount += 1
+        if self.frameCount % self.frame_skip:
+            self.wait_for_frame()
+            return
+
+        self.update_inputs()
+
+        # The play field is drawn in full when PLAYING starts, after that only
+        # the tiles that change are repainted
+        if self.state == _STATE_PLAYING:
+            snake = self.snake
+            food = self.food
+
+            snake.update_direction(self.pressed)
+            result = snake.step(self.level, food)
+            new_x = result & 0xFF
+            new_y = (result >> 8) & 0xFF
+            event = result >> 16
+
+            if event == _EVENT_EAT:
+                self.score += 1
+                self.update_speed()
+                snake.push(new_x, new_y)
+                food.reset_position(snake, self.level)
+                snake.show_changes()
+                food.show()
+
+            elif event == _EVENT_CRASH:
+                self.cooldown = self.countdown
+                self.state = _STATE_SCORE
+
+            else:
+                snake.push(new_x, new_y)
+                snake.pop()
+                if snake.moving():
+                    snake.show_changes()
+        else:
             self.draw_background()
+            self.cooldown -= 1
+            self.show_game_text()
+            if self.cooldown < 0:
+                self.cooldown = self.countdown
+                self.transitions[self.state]()
 
-            if self.state == State.PLAYING:
-                self.draw_game_objects()
+        presto.update()
 
-                self.snake.update_direction(self.pressed)
-                new_head = self.snake.move()
+        self.wait_for_frame()
 
-                if new_head.position == self.food.position:
-                    self.score += 1
-                    self.snake.push(new_head)
-                    self.food.reset_position(self.snake, self.level)
 
-                elif self.snake.moving() and (self.level.check_walls(new_head.position) or self.snake.contains(new_head.position)):
-                    self.cooldown = self.countdown
-                    self.state = State.SCORE
+    def end_title(self) -> None:
+        self.lives_left = 3
+        self.state = _STATE_LEVEL
 
-                else:
-                    self.snake.push(new_head)
-                    self.snake.pop()
-            else:
-                self.cooldown -= 1
-                self.show_game_text()
-                if self.cooldown < 0:
-                    self.cooldown = self.countdown
 
-                    if self.state == State.TITLE:
-                        self.lives_left = 3
-                        self.state = State.LEVEL
+    def end_level(self) -> None:
+        self.init_level()
+        self.state = _STATE_LIVES
 
-                    elif self.state == State.LEVEL:
-                        self.init_level()
-                        self.state = State.LIVES
 
-                    elif self.state == State.LIVES:
-                        self.state = State.PLAYING
+    def end_lives(self) -> None:
+        self.draw_background()
+        self.draw_game_objects()
+        self.state = _STATE_PLAYING
 
-                    elif self.state == State.SCORE:
-                        if self.score > self.target_score:
-                            self.level_number += 1
-                            self.level_number %= self.total_levels
-                        else:
-                            self.lives_left -= 1
 
-                        if self.lives_left == 0:
-                            self.state = State.GAME_OVER
-                        else:
-                            self.state = State.LEVEL
+    def end_score(self) -> None:
+        if self.score > self.target_score:
+            self.level_number += 1
+            self.level_number %= self.total_levels
+        else:
+            self.lives_left -= 1
 
-                    elif self.state == State.GAME_OVER:
-                        self.state = State.TITLE
+        if self.lives_left == 0:
+            self.state = _STATE_GAME_OVER
+        else:
+            self.state = _STATE_LEVEL
 
-            presto.update()
 
-        self.frameCount += 1
-        utime.sleep(self.base_refresh)
+    def end_game_over(self) -> None:
+        self.state = _STATE_TITLE
 
 
-    def map_to_range(self, value, min1, max1, min2, max2) -> int:
+    def wait_for_frame(self) -> None:
+        # Sleep until the next frame is due, so the time spent drawing counts
+        # towards the frame instead of being added on top of it
+        now = self.ticks_ms()
+        deadline = self.ticks_add(self.next_deadline, self.refresh_ms)
+        delay = self.ticks_diff(deadline, now)
+
+        if delay > 0:
+            self.next_deadline = deadline
+            self.sleep_ms(delay)
+        else:
+            # Running behind, don't try to catch up on the missed frames
+            self.next_deadline = now
+
+
+    @micropython.viper
+    def map_to_range(self, value: int, min1: int, max1: int, min2: int, max2: int) -> int:
         if value < min1:
             return min2
         elif value > max1:
             return max2
         else:
-            return min2 + int(((value - min1)//(max1 - min1)) * (max2 - min2))
+            return min2 + (value - min1) * (max2 - min2) // (max1 - min1)
 
 
+    @micropython.native
     def update_inputs(self) -> None:
-        button = self.pad.read_buttons()
-        self.pressed['U'] = button['U']
-        self.pressed['D'] = button['D']
-        self.pressed['L'] = button['L']
-        self.pressed['R'] = button['R']
-        self.pressed['+'] = button['+']
-        self.pressed['-'] = button['-']
+        # read_buttons() already returns a dict keyed by button name
+        self.pressed = self.pad.read_buttons()
 
 
     def draw_background(self) -> None:
@@ -371,26 +593,35 @@ class Game:
 
 
     def show_game_text(self) -> None:
-        if self.state == State.TITLE:
-            self.display_text("Presto", 20, 35, SCORE_COLOR)
-            self.display_text_center("Snake", 20, TITLE_COLOR)
+        handler = self.text_handlers[self.state]
+        if handler:
+            handler()
+
 
-        elif self.state == State.LEVEL:
-            self.display_text("Level", 20, 35, SCORE_COLOR)
-            self.display_text(str(self.level_number), 20, 80, SCORE_COLOR)
+    def title_text(self) -> None:
+        self.display_text("Presto", 20, 35, SCORE_COLOR)
+        self.display_text_center("Snake", 20, TITLE_COLOR)
 
-        elif self.state == State.LIVES:
-            self.display_text("Lives", 20, 35, SCORE_COLOR)
-            self.display_text(str(self.lives_left), 20, 80, SCORE_COLOR)
 
-        elif self.state == State.SCORE:
-            self.display_text("Score", 20, 35, SCORE_COLOR)
-            self.display_text(str(self.score), 20, 80, SCORE_COLOR)
+    def level_text(self) -> None:
+        self.display_text("Level", 20, 35, SCORE_COLOR)
+        self.display_text(str(self.level_number), 20, 80, SCORE_COLOR)
 
-        elif self.state == State.GAME_OVER:
-            self.draw_game_objects()
-            display.text("Game", 20, 35, SCORE_COLOR)
-            display.text("Over", 20, 80, SCORE_COLOR)
+
+    def lives_text(self) -> None:
+        self.display_text("Lives", 20, 35, SCORE_COLOR)
+        self.display_text(str(self.lives_left), 20, 80, SCORE_COLOR)
+
+
+    def score_text(self) -> None:
+        self.display_text("Score", 20, 35, SCORE_COLOR)
+        self.display_text(str(self.score), 20, 80, SCORE_COLOR)
+
+
+    def game_over_text(self) -> None:
+        self.draw_game_objects()
+        display.text("Game", 20, 35, SCORE_COLOR)
+        display.text("Over", 20, 80, SCORE_COLOR)
 
 
     def display_text(self, text, x, y, pen) -> None:
@@ -400,8 +631,13 @@ class Game:
         display.text(text, x, y)
 
     def display_text_center(self, text, y, pen) -> None:
-        x = display.measure_text(text, 3)
-        self.display_text(text, x, y, pen)
+        # Labels are static, so each one only needs measuring once
+        width = self.text_widths.get(text)
+        if width is None:
+            width = display.measure_text(text)
+            self.text_widths[text] = width
+
+        self.display_text(text, (WIDTH - width) // 2, y, pen)
 
 
 # Create the snake pit